@@ -0,0 +1,101 @@
+# =========================================
+# file: tests/test_pf_calcs.py
+# =========================================
+import math
+import random
+
+import pytest
+
+from tools.pf_calcs import _estimate_debt_payoff
+
+
+def _loop_payoff(balance: float, apr_pct: float, payment: float, max_months: int = 600) -> dict:
+    """
+    Reference: the original month-by-month amortization loop the closed form replaced.
+    Only the fields the comparison needs (status, months, total_interest).
+    """
+    if balance <= 0:
+        return {"status": "paid_off", "months": 0, "total_interest": 0.0}
+
+    monthly_rate = max(apr_pct, 0.0) / 100.0 / 12.0
+    if payment <= 0:
+        return {"status": "no_payment", "months": None, "total_interest": None}
+    if monthly_rate <= 0:
+        return {"status": "paid_off", "months": int(math.ceil(balance / payment)), "total_interest": 0.0}
+    if payment <= balance * monthly_rate:
+        return {"status": "non_amortizing", "months": None, "total_interest": None}
+
+    months = 0
+    total_interest = 0.0
+    b = balance
+    while b > 0 and months < max_months:
+        interest = b * monthly_rate
+        b -= payment - interest
+        total_interest += interest
+        months += 1
+
+    if b > 0:
+        return {"status": "too_long", "months": None, "total_interest": total_interest}
+    return {"status": "paid_off", "months": months, "total_interest": total_interest}
+
+
+def _payment_for_months(balance: float, apr_pct: float, months: int) -> float:
+    r = apr_pct / 100.0 / 12.0
+    return balance * r / (1.0 - (1.0 + r) ** -months)
+
+
+def _random_cases(n: int = 2000):
+    rng = random.Random(1)
+    for _ in range(n):
+        yield (
+            rng.choice([0, 1, 50, 500, 5000, 25000, 250000]) * rng.random(),
+            rng.choice([0, 0.5, 3, 7, 19.99, 29.99, 60]) * rng.random(),
+            rng.choice([1, 10, 100, 1000, 5000]) * rng.random(),
+        )
+
+
+BOUNDARY_CASES = [
+    (1200.0, 12.0, 12.0),                                          # payment == balance * r
+    (1200.0, 12.0, 12.000001),                                     # barely amortizing (too long)
+    (100.0, 0.0, 30.0),                                            # r == 0
+    (90.0, 0.0, 30.0),                                             # r == 0, exact division
+    (100.0, 24.0, 102.0),                                          # one month, B(1+r) == P
+    (100.0, 24.0, 101.99),                                         # just misses one month
+    (10000.0, 5.0, _payment_for_months(10000.0, 5.0, 600) * 0.999999),  # n just over 600
+    (10000.0, 5.0, _payment_for_months(10000.0, 5.0, 600) * 1.000001),  # n just under 600
+    (0.0, 10.0, 100.0),                                            # nothing owed
+    (500.0, 10.0, 0.0),                                            # no payment
+]
+
+
+@pytest.mark.parametrize("balance,apr_pct,payment", BOUNDARY_CASES + list(_random_cases()))
+def test_closed_form_matches_loop(balance, apr_pct, payment):
+    expected = _loop_payoff(balance, apr_pct, payment)
+    got = _estimate_debt_payoff(balance, apr_pct, payment)
+
+    assert got["status"] == expected["status"]
+    assert got["months"] == expected["months"]
+    if expected["total_interest"] is None:
+        assert got["total_interest"] is None
+    else:
+        assert got["total_interest"] == pytest.approx(expected["total_interest"], rel=1e-9, abs=1e-9)
+
+
+def test_boundary_statuses():
+    # Guard the boundary cases themselves, so they keep exercising the branch they're named for
+    statuses = [_loop_payoff(*case)["status"] for case in BOUNDARY_CASES]
+    assert statuses == [
+        "non_amortizing",
+        "too_long",
+        "paid_off",
+        "paid_off",
+        "paid_off",
+        "paid_off",
+        "too_long",
+        "paid_off",
+        "paid_off",
+        "no_payment",
+    ]
+    assert _loop_payoff(*BOUNDARY_CASES[4])["months"] == 1
+    assert _loop_payoff(*BOUNDARY_CASES[5])["months"] == 2
+    assert _loop_payoff(*BOUNDARY_CASES[7])["months"] == 600
@@ -15,7 +15,7 @@ from tools.pf_state import (
     build_payload_from_state,
 )
 from tools.pf_persistence import load_pf_state, upsert_pf_state
-from tools.pf_calcs import compute_metrics
+from tools.pf_calcs import compute_metrics, variable_for_visuals
 from tools.pf_ui_income import render_income_tab
 from tools.pf_ui_expenses import render_expenses_tab
 from tools.pf_ui_saveinvest import render_saveinvest_tab
@@ -114,20 +114,118 @@ DEFAULT_LIABILITIES = [
     {"Liability": "Tax Liability", "Value": 0.0, "Notes": ""},
 ]
 
+# Default tables as DataFrames, built once per process at import.
+# ensure_df copies these into each new session.
+_DEFAULT_INCOME_DF = pd.DataFrame(DEFAULT_INCOME)
+_DEFAULT_FIXED_DF = pd.DataFrame(DEFAULT_FIXED)
+_DEFAULT_ESSENTIAL_DF = pd.DataFrame(DEFAULT_ESSENTIAL)
+_DEFAULT_NON_ESSENTIAL_DF = pd.DataFrame(DEFAULT_NON_ESSENTIAL)
+_DEFAULT_SAVING_DF = pd.DataFrame(DEFAULT_SAVING)
+_DEFAULT_INVESTING_DF = pd.DataFrame(DEFAULT_INVESTING)
+_DEFAULT_DEBT_DF = pd.DataFrame(DEFAULT_DEBT)
+_DEFAULT_ASSETS_DF = pd.DataFrame(DEFAULT_ASSETS)
+_DEFAULT_LIABILITIES_DF = pd.DataFrame(DEFAULT_LIABILITIES)
+
 
 # -------------------------
 # UI helpers
 # -------------------------
+_HEADER_CSS = """
+<style>
+  .pf-hdr {
+    border: 1px solid rgba(128, 128, 128, .25);
+    border-radius: .5rem;
+    padding: 1rem;
+    margin-bottom: 1rem;
+  }
+  .pf-hdr-row {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 1rem;
+    margin-top: .5rem;
+  }
+  .pf-hdr-item {
+    flex: 1 1 0;
+    min-width: 8rem;
+  }
+  .pf-hdr-label {
+    font-size: .875rem;
+  }
+  .pf-hdr-value {
+    font-size: 1.75rem;
+    line-height: 1.4;
+  }
+</style>
+"""
+
+
+def _dashboard_header_html(net_income, total_outflow, remaining, emergency_minimum_monthly, net_worth, debt_payments) -> str:
+    items = [
+        ("Net Income", net_income),
+        ("Expenses", total_outflow),
+        ("Leftover", remaining),
+        ("Emergency Min", emergency_minimum_monthly),
+        ("Net Worth", net_worth),
+        ("Debt Min", debt_payments),
+    ]
+    # &#36; keeps the markdown renderer from reading "$...$" pairs as math
+    cells = "".join(
+        f"<div class='pf-hdr-item'><div class='pf-hdr-label'>{label}</div>"
+        f"<div class='pf-hdr-value'>{money(value).replace('$', '&#36;')}</div></div>"
+        for label, value in items
+    )
+    return (
+        f"{_HEADER_CSS.strip()}\n<div class='pf-hdr'><strong>Monthly Outlook</strong>"
+        f"<div class='pf-hdr-row'>{cells}</div></div>"
+    )
+
+
 def _dashboard_header(net_income, total_outflow, remaining, emergency_minimum_monthly, net_worth, debt_payments):
-    with st.container(border=True):
-        st.markdown("**Monthly Outlook**")
-        a, b, c, d, e, f = st.columns(6, gap="medium")
-        a.metric("Net Income", money(net_income))
-        b.metric("Expenses", money(total_outflow))
-        c.metric("Leftover", money(remaining))
-        d.metric("Emergency Min", money(emergency_minimum_monthly))
-        e.metric("Net Worth", money(net_worth))
-        f.metric("Debt Min", money(debt_payments))
+    # One markdown element instead of a container + six metrics
+    st.markdown(
+        _dashboard_header_html(
+            net_income, total_outflow, remaining, emergency_minimum_monthly, net_worth, debt_payments
+        ),
+        unsafe_allow_html=True,
+    )
+
+
+@st.fragment
+def _debt_summary(net_income, total_monthly_debt_payments):
+    # Own fragment: switching the payoff strategy reruns just these charts, not the page
+    c1, c2, c3 = st.columns([0.55, 0.85, 1.2], gap="large")
+
+    with c1:
+        with st.container(border=True):
+            st.metric("Total Monthly Debt Payments", money(total_monthly_debt_payments))
+
+    with c2:
+        st.caption(
+            "**Debt Burden** shows what % of your take-home pay goes to minimum debt payments each month. "
+            "Under ~15% feels light, 15-30% is moderate, 30%+ is heavy."
+        )
+        fig_burden, _ = debt_burden_indicator(
+            net_income=net_income,
+            debt_payments=total_monthly_debt_payments,
+        )
+        st.plotly_chart(fig_burden, width="stretch", key="pf_debt_burden_chart")
+
+    with c3:
+        st.caption(
+            "**Payoff Order** ranks your debts for where to focus extra payments. "
+            "Bars show **balance**, and the label on each bar is the **APR**."
+        )
+        strategy = st.radio(
+            "Payoff strategy",
+            ["Avalanche (APR)", "Snowball (Balance)"],
+            horizontal=True,
+            key="pf_debt_strategy",
+        )
+        fig_order = debt_payoff_order_chart(
+            st.session_state["pf_debt_df"],
+            strategy=strategy,
+        )
+        st.plotly_chart(fig_order, width="stretch", key="pf_debt_order_chart")
 
 
 # -------------------------
@@ -153,7 +251,9 @@ def render_personal_finance_dashboard(user):
     st.title("💸 Financial Breakdown")
 
     # ---- Widget defaults ----
-    st.session_state.setdefault("pf_month_label", datetime.now().strftime("%B %Y"))
+    if "pf_month_label" not in st.session_state:
+        # setdefault would format the clock on every rerun just to throw it away
+        st.session_state["pf_month_label"] = datetime.now().strftime("%B %Y")
     st.session_state.setdefault("pf_tax_rate", 0.0)
     st.session_state.setdefault("pf_income_is", "Net (after tax)")
 
@@ -169,15 +269,15 @@ def render_personal_finance_dashboard(user):
     st.session_state.setdefault("pf_manual_other_ssi", 0.0)
 
     # ---- Persisted tables ----
-    ensure_df("pf_income_df", DEFAULT_INCOME)
-    ensure_df("pf_fixed_df", DEFAULT_FIXED)
-    ensure_df("pf_essential_df", DEFAULT_ESSENTIAL)
-    ensure_df("pf_nonessential_df", DEFAULT_NON_ESSENTIAL)
-    ensure_df("pf_saving_df", DEFAULT_SAVING)
-    ensure_df("pf_investing_df", DEFAULT_INVESTING)
-    ensure_df("pf_debt_df", DEFAULT_DEBT)
-    ensure_df("pf_assets_df", DEFAULT_ASSETS)
-    ensure_df("pf_liabilities_df", DEFAULT_LIABILITIES)
+    ensure_df("pf_income_df", _DEFAULT_INCOME_DF)
+    ensure_df("pf_fixed_df", _DEFAULT_FIXED_DF)
+    ensure_df("pf_essential_df", _DEFAULT_ESSENTIAL_DF)
+    ensure_df("pf_nonessential_df", _DEFAULT_NON_ESSENTIAL_DF)
+    ensure_df("pf_saving_df", _DEFAULT_SAVING_DF)
+    ensure_df("pf_investing_df", _DEFAULT_INVESTING_DF)
+    ensure_df("pf_debt_df", _DEFAULT_DEBT_DF)
+    ensure_df("pf_assets_df", _DEFAULT_ASSETS_DF)
+    ensure_df("pf_liabilities_df", _DEFAULT_LIABILITIES_DF)
 
     # -------------------------
     # CALCULATIONS
@@ -253,11 +353,9 @@ def render_personal_finance_dashboard(user):
             # Sort largest > smallest
             df = df.sort_values(by=amount_col, ascending=False)
 
-            # List each item
-            for _, row in df.iterrows():
-                name = str(row.get(name_col, ""))
-                amount = float(row.get(amount_col, 0.0))
-                st.markdown(f"- **{name}**: {money(amount)}")
+            # List each item (column-wise, one markdown element for the whole list)
+            items = zip(df[name_col].astype(str), df[amount_col].astype(float))
+            st.markdown("\n".join(f"- **{name}**: {money(amount)}" for name, amount in items))
 
             # Total
             total = df[amount_col].sum()
@@ -303,7 +401,7 @@ def render_personal_finance_dashboard(user):
         investing_cashflow=metrics["investing_cashflow"],
         remaining=metrics["remaining"],
         fixed_df=metrics["fixed_df"],
-        variable_df=metrics["variable_for_visuals"],
+        variable_df=variable_for_visuals(metrics["essential_df"], metrics["nonessential_df"]),
         debt_df=metrics["debt_df"],
     )
 
@@ -510,39 +608,7 @@ def render_personal_finance_dashboard(user):
     has_any_debt = (total_debt_balance > 0) or (total_monthly_debt_payments > 0)
 
     with st.expander("Debt Summary", expanded=has_any_debt):
-        c1, c2, c3 = st.columns([0.55, 0.85, 1.2], gap="large")
-
-        with c1:
-            with st.container(border=True):
-                st.metric("Total Monthly Debt Payments", money(total_monthly_debt_payments))
-
-        with c2:
-            st.caption(
-                "**Debt Burden** shows what % of your take-home pay goes to minimum debt payments each month. "
-                "Under ~15% feels light, 15-30% is moderate, 30%+ is heavy."
-            )
-            fig_burden, _ = debt_burden_indicator(
-                net_income=net_income,
-                debt_payments=total_monthly_debt_payments,
-            )
-            st.plotly_chart(fig_burden, width="stretch", key="pf_debt_burden_chart")
-
-        with c3:
-            st.caption(
-                "**Payoff Order** ranks your debts for where to focus extra payments. "
-                "Bars show **balance**, and the label on each bar is the **APR**."
-            )
-            strategy = st.radio(
-                "Payoff strategy",
-                ["Avalanche (APR)", "Snowball (Balance)"],
-                horizontal=True,
-                key="pf_debt_strategy",
-            )
-            fig_order = debt_payoff_order_chart(
-                st.session_state["pf_debt_df"],
-                strategy=strategy,
-            )
-            st.plotly_chart(fig_order, width="stretch", key="pf_debt_order_chart")
+        _debt_summary(net_income, total_monthly_debt_payments)
 
     st.divider()
 
@@ -559,7 +625,6 @@ def render_personal_finance_dashboard(user):
                 "If you want to come back to these exact numbers later, save them to your login."
             )
 
-            pf_payload = build_payload_from_state(metrics)
             user_id = getattr(user, "id", None)
 
             save_col = st.columns(1)[0]
@@ -575,7 +640,8 @@ def render_personal_finance_dashboard(user):
 
                 if st.button(btn_label, type="primary", width="stretch", disabled=save_disabled):
                     try:
-                        upsert_pf_state(user_id, pf_payload)
+                        # Only built on click; nothing to serialize on ordinary reruns
+                        upsert_pf_state(user_id, build_payload_from_state(metrics))
                         st.success("Saved to your account.")
                     except Exception as e:
                         st.error(f"Save failed: {e}")
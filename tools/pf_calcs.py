@@ -4,21 +4,128 @@
 from __future__ import annotations
 
 import math
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from tools.pf_state import sum_df
+from tools.pf_state import numeric_column, safe_float, sum_df
+
+
+@dataclass(slots=True)
+class _Manuals:
+    """Paycheck-breakdown deductions, read from session state once per rerun."""
+    taxes: float
+    retirement: float
+    benefits: float
+    other_ssi: float
+    match: float
+
+
+_MANUAL_KEYS = (
+    "pf_manual_taxes",
+    "pf_manual_retirement",
+    "pf_manual_benefits",
+    "pf_manual_other_ssi",
+    "pf_manual_match",
+)
+
+
+def _read_manuals() -> _Manuals:
+    return _Manuals(*(safe_float(st.session_state.get(k, 0.0) or 0.0) for k in _MANUAL_KEYS))
+
+
+# Payoff status codes used by _estimate_debt_payoff_vec (index into _PAYOFF_STATUSES)
+_PAID_OFF, _NO_PAYMENT, _NON_AMORTIZING, _TOO_LONG = range(4)
+_PAYOFF_STATUSES = ("paid_off", "no_payment", "non_amortizing", "too_long")
+_MAX_PAYOFF_MONTHS = 600
+
+
+def _payoff_reason(status: str, max_months: int) -> str | None:
+    if status == "no_payment":
+        return "No monthly payment entered."
+    if status == "non_amortizing":
+        return "Payment is less than (or equal to) monthly interest, so the balance will grow."
+    if status == "too_long":
+        return f"Not paid off within {max_months} months."
+    return None
+
+
+def _estimate_debt_payoff_vec(balance, apr_pct, payment, max_months: int = _MAX_PAYOFF_MONTHS) -> dict:
+    """
+    Closed-form amortization estimate for a whole column of debts at once.
+
+    Returns a dict of equal-length numpy arrays:
+      - status: int codes (see _PAYOFF_STATUSES)
+      - months: float, NaN where there is no payoff
+      - total_interest: float, NaN where unknown
+      - monthly_interest: float
+      - min_payment_to_amortize: float
+    """
+    bal = np.asarray(balance, dtype=float)
+    pay = np.asarray(payment, dtype=float)
+    rate = np.maximum(np.asarray(apr_pct, dtype=float), 0.0) / 100.0 / 12.0
+    monthly_interest = np.where(rate > 0, bal * rate, 0.0)
+
+    paid = bal <= 0
+    no_payment = ~paid & (pay <= 0)
+    no_interest = ~paid & ~no_payment & (rate <= 0)
+    non_amortizing = ~paid & ~no_payment & ~no_interest & (pay <= monthly_interest)
+    amortizing = ~paid & ~no_payment & ~no_interest & ~non_amortizing
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # With b' = b(1+r) - P the balance hits zero after n = log(P / (P - rB)) / log(1+r)
+        # months. Payments are whole months, so the last one overshoots; the interest
+        # actually paid is months*P - B + b_final. (The small epsilon keeps an exact n,
+        # e.g. 1.0000000000000002, from rounding up to an extra month.)
+        # log1p/expm1 keep small monthly rates from cancelling out against the 1.
+        n = -np.log1p(-rate * bal / pay) / np.log1p(rate)
+        amort_months = np.minimum(np.ceil(n - 1e-9), max_months)
+        growth_m1 = np.expm1(amort_months * np.log1p(rate))
+        b_final = bal * (1.0 + growth_m1) - pay * growth_m1 / rate
+        amort_interest = amort_months * pay - bal + b_final
+        # No interest case: straight division
+        flat_months = np.ceil(bal / pay)
+
+    too_long = amortizing & (n > max_months)
+    paid_via_amortization = amortizing & ~too_long
+
+    status = np.full(bal.shape, _PAID_OFF)
+    status[no_payment] = _NO_PAYMENT
+    status[non_amortizing] = _NON_AMORTIZING
+    status[too_long] = _TOO_LONG
+
+    months = np.full(bal.shape, np.nan)
+    months[paid] = 0.0
+    months[no_interest] = flat_months[no_interest]
+    months[paid_via_amortization] = amort_months[paid_via_amortization]
+
+    total_interest = np.full(bal.shape, np.nan)
+    total_interest[paid | no_interest] = 0.0
+    total_interest[amortizing] = amort_interest[amortizing]
+
+    monthly_interest = np.where(paid, 0.0, monthly_interest)
+    min_payment = np.where(paid | no_interest | (rate <= 0), 0.0, monthly_interest + 1.0)
+
+    return {
+        "status": status,
+        "months": months,
+        "total_interest": total_interest,
+        "monthly_interest": monthly_interest,
+        "min_payment_to_amortize": min_payment,
+    }
 
 
 def _estimate_debt_payoff(
     balance: float,
     apr_pct: float,
     payment: float,
-    max_months: int = 600,
+    max_months: int = _MAX_PAYOFF_MONTHS,
 ):
     """
-    Simple amortization loop to estimate months to payoff + total interest.
+    Closed-form amortization estimate of months to payoff + total interest
+    for a single debt (see _estimate_debt_payoff_vec).
 
     Returns a dict:
       - status: "paid_off" | "no_payment" | "non_amortizing" | "too_long"
@@ -28,116 +135,84 @@ def _estimate_debt_payoff(
       - min_payment_to_amortize: float
       - reason: str | None
     """
-    balance = float(balance or 0.0)
-    apr_pct = float(apr_pct or 0.0)
-    payment = float(payment or 0.0)
-
-    if balance <= 0:
-        return {"status": "paid_off", "months": 0, "total_interest": 0.0, "monthly_interest": 0.0,
-                "min_payment_to_amortize": 0.0, "reason": None}
-
-    monthly_rate = max(apr_pct, 0.0) / 100.0 / 12.0
-    monthly_interest = balance * monthly_rate if monthly_rate > 0 else 0.0
-
-    if payment <= 0:
-        return {
-            "status": "no_payment",
-            "months": None,
-            "total_interest": None,
-            "monthly_interest": monthly_interest,
-            "min_payment_to_amortize": monthly_interest + 1.0 if monthly_rate > 0 else 0.0,
-            "reason": "No monthly payment entered.",
-        }
-
-    # No interest case: straight division
-    if monthly_rate <= 0:
-        months = int(math.ceil(balance / payment))
-        return {
-            "status": "paid_off",
-            "months": months,
-            "total_interest": 0.0,
-            "monthly_interest": 0.0,
-            "min_payment_to_amortize": 0.0,
-            "reason": None,
-        }
-
-    # Payment doesn't cover interest > balance grows > no payoff
-    if payment <= monthly_interest:
-        min_payment = monthly_interest + 1.0
-        return {
-            "status": "non_amortizing",
-            "months": None,
-            "total_interest": None,
-            "monthly_interest": monthly_interest,
-            "min_payment_to_amortize": min_payment,
-            "reason": "Payment is less than (or equal to) monthly interest, so the balance will grow.",
-        }
-
-    # Amortize until paid or cap
-    months = 0
-    total_interest = 0.0
-    b = balance
-
-    while b > 0 and months < max_months:
-        interest = b * monthly_rate
-        principal = payment - interest
-
-        if principal <= 0:
-            return {
-                "status": "non_amortizing",
-                "months": None,
-                "total_interest": None,
-                "monthly_interest": interest,
-                "min_payment_to_amortize": interest + 1.0,
-                "reason": "Payment doesn't reduce principal.",
-            }
-
-        b -= principal
-        total_interest += interest
-        months += 1
-
-    if b > 0:
-        return {
-            "status": "too_long",
-            "months": None,
-            "total_interest": total_interest,
-            "monthly_interest": monthly_interest,
-            "min_payment_to_amortize": monthly_interest + 1.0,
-            "reason": f"Not paid off within {max_months} months.",
-        }
+    est = _estimate_debt_payoff_vec(
+        [float(balance or 0.0)],
+        [float(apr_pct or 0.0)],
+        [float(payment or 0.0)],
+        max_months=max_months,
+    )
+    status = _PAYOFF_STATUSES[int(est["status"][0])]
+    months = float(est["months"][0])
+    total_interest = float(est["total_interest"][0])
 
     return {
-        "status": "paid_off",
-        "months": months,
-        "total_interest": total_interest,
-        "monthly_interest": monthly_interest,
-        "min_payment_to_amortize": monthly_interest + 1.0,
-        "reason": None,
+        "status": status,
+        "months": None if math.isnan(months) else int(months),
+        "total_interest": None if math.isnan(total_interest) else total_interest,
+        "monthly_interest": float(est["monthly_interest"][0]),
+        "min_payment_to_amortize": float(est["min_payment_to_amortize"][0]),
+        "reason": _payoff_reason(status, max_months),
     }
 
 
+_METRIC_TABLES = (
+    "income_df",
+    "fixed_df",
+    "essential_df",
+    "nonessential_df",
+    "saving_df",
+    "investing_df",
+    "debt_df",
+    "assets_df",
+    "liabilities_df",
+)
+
+
 def compute_metrics() -> dict:
-    income_df = st.session_state["pf_income_df"]
-    fixed_df = st.session_state["pf_fixed_df"]
-    essential_df = st.session_state["pf_essential_df"]
-    nonessential_df = st.session_state["pf_nonessential_df"]
-    saving_df = st.session_state["pf_saving_df"]
-    investing_df = st.session_state["pf_investing_df"]
-    debt_df = st.session_state["pf_debt_df"]
-    assets_df = st.session_state["pf_assets_df"]
-    liabilities_df = st.session_state["pf_liabilities_df"]
+    tables = {k: st.session_state[f"pf_{k}"] for k in _METRIC_TABLES}
+    metrics = _compute_metrics_pure(
+        *tables.values(),
+        manuals=_read_manuals(),
+        use_breakdown=bool(st.session_state.get("pf_use_paycheck_breakdown", False)),
+        today=date.today(),
+    )
+    return {**tables, **metrics}
+
+
+def _compute_metrics_pure(
+    income_df: pd.DataFrame,
+    fixed_df: pd.DataFrame,
+    essential_df: pd.DataFrame,
+    nonessential_df: pd.DataFrame,
+    saving_df: pd.DataFrame,
+    investing_df: pd.DataFrame,
+    debt_df: pd.DataFrame,
+    assets_df: pd.DataFrame,
+    liabilities_df: pd.DataFrame,
+    *,
+    manuals: _Manuals,
+    use_breakdown: bool,
+    today: date,
+) -> dict:
+    """Every dashboard number, derived only from its arguments (no session_state reads)."""
+    # Debt columns coerced once, column-wise (no per-row float() calls)
+    debt_names = (
+        debt_df.get("Debt", pd.Series("", index=debt_df.index, dtype=object))
+        .fillna("")
+        .astype(str)
+        .str.strip()
+        .replace("", "Debt")
+    )
+    debt_bal = numeric_column(debt_df, "Balance")
+    debt_apr = numeric_column(debt_df, "APR %")
+    debt_pay = numeric_column(debt_df, "Monthly Payment")
 
     # -------- Income/Deductions --------
     total_income = sum_df(income_df, "Monthly Amount")
 
-    manual_taxes = float(st.session_state.get("pf_manual_taxes", 0.0) or 0.0)
-    manual_retirement = float(st.session_state.get("pf_manual_retirement", 0.0) or 0.0)
-    manual_benefits = float(st.session_state.get("pf_manual_benefits", 0.0) or 0.0)
-    manual_other_ssi = float(st.session_state.get("pf_manual_other_ssi", 0.0) or 0.0)
-    employer_match = float(st.session_state.get("pf_manual_match", 0.0) or 0.0)
+    m = manuals
 
-    manual_deductions_total = manual_taxes + manual_retirement + manual_benefits + manual_other_ssi
-    use_breakdown = bool(st.session_state.get("pf_use_paycheck_breakdown", False))
+    manual_deductions_total = m.taxes + m.retirement + m.benefits + m.other_ssi
     net_income = total_income - manual_deductions_total if use_breakdown else total_income
 
     # -------- Expenses/Saving/Investing --------
@@ -150,9 +225,9 @@ def compute_metrics() -> dict:
     investing_total = sum_df(investing_df, "Monthly Amount")
 
     investing_cashflow = investing_total
-    investing_display = investing_total + manual_retirement + employer_match
+    investing_display = investing_total + m.retirement + m.match
 
-    total_monthly_debt_payments = sum_df(debt_df, "Monthly Payment")
+    total_monthly_debt_payments = float(debt_pay.sum())
     total_saving_and_investing_cashflow = saving_total + investing_cashflow
 
     total_outflow = expenses_total + total_saving_and_investing_cashflow + total_monthly_debt_payments
@@ -164,8 +239,8 @@ def compute_metrics() -> dict:
     total_liabilities = sum_df(liabilities_df, "Value")
     net_worth = total_assets - total_liabilities
 
-    employee_retirement = float(st.session_state.get("pf_manual_retirement", 0.0) or 0.0)
-    company_match = float(st.session_state.get("pf_manual_match", 0.0) or 0.0)
+    employee_retirement = m.retirement
+    company_match = m.match
     total_retirement_contrib = employee_retirement + company_match
 
     investing_rate_of_gross = (investing_display / total_income) * 100 if total_income > 0 else None
@@ -187,44 +262,46 @@ def compute_metrics() -> dict:
         unallocated_pct = max(0.0, 100 - (needs_pct + wants_pct + save_invest_pct))
 
     # -------- Debt payoff stats --------
-    total_debt_balance = sum_df(debt_df, "Balance")
+    total_debt_balance = float(debt_bal.sum())
 
     # Weighted APR for overall payoff estimate (only meaningful if all debts amortize)
     weighted_apr = None
     if total_debt_balance > 0:
-        num = 0.0
-        for _, row in debt_df.iterrows():
-            bal = float(row.get("Balance", 0.0) or 0.0)
-            apr = float(row.get("APR %", 0.0) or 0.0)
-            num += bal * apr
-        weighted_apr = num / total_debt_balance if total_debt_balance > 0 else None
+        weighted_apr = float((debt_bal * debt_apr).sum()) / total_debt_balance
+
+    # All debts estimated in one vectorized pass; Python only builds the UI rows.
+    est = _estimate_debt_payoff_vec(debt_bal, debt_apr, debt_pay)
+
+    # Keep even "no payment" and "non-amortizing" entries (wake-up call),
+    # but ignore blank/zero-balance rows.
+    keep = debt_bal > 0
+    has_non_amortizing = bool((est["status"][keep] != _PAID_OFF).any())
+
+    # One label per distinct payoff month (debts often share one), not one DateOffset per row
+    start = pd.Timestamp(today)
+    kept_months = est["months"][keep]
+    payoff_dates = {
+        months_ahead: (start + pd.DateOffset(months=months_ahead)).strftime("%b %Y")
+        for months_ahead in np.unique(kept_months[~np.isnan(kept_months)]).astype(int).tolist()
+    }
+    payoff_dates[0] = "Now"
 
     payoff_rows = []
-    has_non_amortizing = False
-
-    for _, row in debt_df.iterrows():
-        name = str(row.get("Debt", "") or "").strip() or "Debt"
-        bal = float(row.get("Balance", 0.0) or 0.0)
-        apr = float(row.get("APR %", 0.0) or 0.0)
-        pay = float(row.get("Monthly Payment", 0.0) or 0.0)
-
-        est = _estimate_debt_payoff(bal, apr, pay)
-
-        # Keep even "no payment" and "non-amortizing" entries (wake-up call),
-        # but ignore blank/zero-balance rows.
-        if bal <= 0:
-            continue
-
-        status = est["status"]
-        if status in ("non_amortizing", "no_payment", "too_long"):
-            has_non_amortizing = True
+    for name, bal, apr, pay, code, months, total_interest, monthly_interest, min_payment in zip(
+        debt_names[keep],
+        debt_bal[keep].tolist(),
+        debt_apr[keep].tolist(),
+        debt_pay[keep].tolist(),
+        est["status"][keep].tolist(),
+        est["months"][keep].tolist(),
+        est["total_interest"][keep].tolist(),
+        est["monthly_interest"][keep].tolist(),
+        est["min_payment_to_amortize"][keep].tolist(),
+    ):
+        status = _PAYOFF_STATUSES[code]
+        months = None if math.isnan(months) else int(months)
 
-        payoff_date = None
-        months = est.get("months")
-        if months is not None and months > 0:
-            payoff_date = (pd.Timestamp.today().normalize() + pd.DateOffset(months=months)).strftime("%b %Y")
-        elif months == 0:
-            payoff_date = "Now"
+        payoff_date = None if months is None else payoff_dates[months]
 
         payoff_rows.append(
             {
@@ -233,12 +310,12 @@ def compute_metrics() -> dict:
                 "apr_pct": apr,
                 "payment": pay,
                 "status": status,
-                "reason": est.get("reason"),
-                "monthly_interest": float(est.get("monthly_interest", 0.0) or 0.0),
-                "min_payment_to_amortize": float(est.get("min_payment_to_amortize", 0.0) or 0.0),
+                "reason": _payoff_reason(status, _MAX_PAYOFF_MONTHS),
+                "monthly_interest": monthly_interest,
+                "min_payment_to_amortize": min_payment,
                 "months": months,
                 "years": (months / 12.0) if months is not None else None,
-                "total_interest": est.get("total_interest"),
+                "total_interest": None if math.isnan(total_interest) else total_interest,
                 "payoff_date": payoff_date,
             }
         )
@@ -264,7 +341,7 @@ def compute_metrics() -> dict:
             overall_interest = overall_est["total_interest"]
             if overall_months is not None:
                 overall_payoff_date = (
-                    pd.Timestamp.today().normalize() + pd.DateOffset(months=overall_months)
+                    start + pd.DateOffset(months=overall_months)
                 ).strftime("%b %Y")
 
     # Debt burden (% of net income)
@@ -272,24 +349,7 @@ def compute_metrics() -> dict:
     if net_income > 0 and total_monthly_debt_payments > 0:
         debt_burden_pct = (total_monthly_debt_payments / net_income) * 100
 
-    # -------- Variable df for visuals --------
-    variable_for_visuals = pd.concat(
-        [essential_df.assign(Category="Essential"), nonessential_df.assign(Category="Non-Essential")],
-        ignore_index=True,
-        sort=False,
-    )
-
     return {
-        "income_df": income_df,
-        "fixed_df": fixed_df,
-        "essential_df": essential_df,
-        "nonessential_df": nonessential_df,
-        "saving_df": saving_df,
-        "investing_df": investing_df,
-        "debt_df": debt_df,
-        "assets_df": assets_df,
-        "liabilities_df": liabilities_df,
-
         "total_income": total_income,
         "net_income": net_income,
         "manual_deductions_total": manual_deductions_total,
@@ -327,8 +387,6 @@ def compute_metrics() -> dict:
         "save_invest_pct": save_invest_pct,
         "unallocated_pct": unallocated_pct,
 
-        "variable_for_visuals": variable_for_visuals,
-
         "total_debt_balance": total_debt_balance,
         "debt_weighted_apr": weighted_apr,
         "debt_payoff_rows": payoff_rows,
@@ -337,4 +395,18 @@ def compute_metrics() -> dict:
         "debt_overall_interest": overall_interest,
         "debt_overall_payoff_date": overall_payoff_date,
         "debt_burden_pct": debt_burden_pct,
-    }
\ No newline at end of file
+    }
+
+
+def variable_for_visuals(essential_df: pd.DataFrame, nonessential_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Essential + non-essential rows tagged with a Category, for the visual overview.
+
+    Kept out of compute_metrics so the concat only runs when the charts ask for it.
+    """
+    # Dict keys become the Category level, so neither table is copied just to add a column
+    return (
+        pd.concat({"Essential": essential_df, "Non-Essential": nonessential_df}, names=["Category"], sort=False)
+        .reset_index(level="Category")
+        .reset_index(drop=True)
+    )
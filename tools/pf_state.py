@@ -4,11 +4,39 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List
+from typing import List
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 
+# Auto-added index / id-ish columns that st.data_editor can hand back
+_DROP_CANDIDATES = frozenset({"id", "_id", "__id", "row_id", "_row_id", "index", "__index__"})
+
+# Paycheck breakdown fields: (payload "gross_breakdown_optional" key,
+# suffix of the pf_manual_* / pf_draft_* session keys)
+_GROSS_BREAKDOWN_FIELDS = (
+    ("taxes", "taxes"),
+    ("retirement_employee", "retirement"),
+    ("company_match", "match"),
+    ("benefits", "benefits"),
+    ("other_ssi", "other_ssi"),
+)
+
+# Saved tables: (payload "tables" key, session_state key)
+_PAYLOAD_TABLES = (
+    ("income", "pf_income_df"),
+    ("fixed_expenses", "pf_fixed_df"),
+    ("essential_expenses", "pf_essential_df"),
+    ("nonessential_expenses", "pf_nonessential_df"),
+    ("saving", "pf_saving_df"),
+    ("investing", "pf_investing_df"),
+    ("assets", "pf_assets_df"),
+    ("liabilities", "pf_liabilities_df"),
+    ("debt_details", "pf_debt_df"),
+)
+
+
 # -------------------------
 # Helpers
 # -------------------------
@@ -27,22 +55,40 @@ def safe_float(x, default=0.0) -> float:
         return float(default)
 
 
+def numeric_column(df: pd.DataFrame, col: str) -> np.ndarray:
+    """float64 view of a column; blanks/garbage become 0.0, a missing column is all zeros."""
+    if df is None or col not in df.columns:
+        return np.zeros(0 if df is None else len(df), dtype=np.float64)
+    return pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=0.0)
+
+
 def sum_df(df: pd.DataFrame, col: str) -> float:
-    if df is None or df.empty or col not in df.columns:
-        return 0.0
-    return float(pd.to_numeric(df[col], errors="coerce").fillna(0).sum())
+    return float(numeric_column(df, col).sum())
 
 
-def ensure_df(key: str, default_rows: List[Dict]) -> pd.DataFrame:
+def ensure_df(key: str, default_df: pd.DataFrame) -> pd.DataFrame:
     """
     Ensure st.session_state[key] is a DataFrame.
-    If missing, seed it with default_rows.
+    If missing, seed it with a copy of default_df (a module-level template,
+    so the template itself is never edited).
     """
     if key not in st.session_state or not isinstance(st.session_state[key], pd.DataFrame):
-        st.session_state[key] = pd.DataFrame(default_rows)
+        st.session_state[key] = default_df.copy(deep=True)
     return st.session_state[key]
 
 
+def _is_clean_editor_df(df: pd.DataFrame, expected_cols: List[str], numeric_cols: List[str]) -> bool:
+    """True if df is already in the shape sanitize_editor_df would produce."""
+    if list(df.columns) != list(expected_cols):
+        return False
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        return False
+    for c in numeric_cols:
+        if df[c].dtype.kind != "f" or df[c].isna().any():
+            return False
+    return True
+
+
 def sanitize_editor_df(df: pd.DataFrame, expected_cols: List[str], numeric_cols: List[str]) -> pd.DataFrame:
     """
     Clean up a DataFrame coming from st.data_editor:
@@ -52,9 +98,10 @@ def sanitize_editor_df(df: pd.DataFrame, expected_cols: List[str], numeric_cols:
     """
     if df is None or not isinstance(df, pd.DataFrame):
         df = pd.DataFrame(columns=expected_cols)
+    elif _is_clean_editor_df(df, expected_cols, numeric_cols):
+        return df
 
-    drop_candidates = {"id", "_id", "__id", "row_id", "_row_id", "index", "__index__"}
-    extra = [c for c in df.columns if str(c).strip().lower() in drop_candidates]
+    extra = [c for c in df.columns if str(c).strip().lower() in _DROP_CANDIDATES]
     if extra:
         df = df.drop(columns=extra, errors="ignore")
 
@@ -62,10 +109,11 @@ def sanitize_editor_df(df: pd.DataFrame, expected_cols: List[str], numeric_cols:
         if c not in df.columns:
             df[c] = "" if c not in numeric_cols else 0.0
 
-    df = df[expected_cols].copy()
+    # Reorder/select without forcing a copy; blocks are shared when possible.
+    df = df.reindex(columns=expected_cols, copy=False)
 
-    for c in numeric_cols:
-        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0.0)
+    # One coerce + fill over all numeric columns, written back in a single assignment
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0).astype(np.float64)
 
     df = df.reset_index(drop=True)
     return df
@@ -105,21 +153,9 @@ def apply_payload_to_state(payload: dict) -> None:
 
     # ---- Optional gross breakdown ----
     gb = payload.get("gross_breakdown_optional", {}) or {}
-    st.session_state["pf_manual_taxes"] = safe_float(
-        gb.get("taxes", st.session_state.get("pf_manual_taxes", 0.0))
-    )
-    st.session_state["pf_manual_retirement"] = safe_float(
-        gb.get("retirement_employee", st.session_state.get("pf_manual_retirement", 0.0))
-    )
-    st.session_state["pf_manual_match"] = safe_float(
-        gb.get("company_match", st.session_state.get("pf_manual_match", 0.0))
-    )
-    st.session_state["pf_manual_benefits"] = safe_float(
-        gb.get("benefits", st.session_state.get("pf_manual_benefits", 0.0))
-    )
-    st.session_state["pf_manual_other_ssi"] = safe_float(
-        gb.get("other_ssi", st.session_state.get("pf_manual_other_ssi", 0.0))
-    )
+    for gb_key, name in _GROSS_BREAKDOWN_FIELDS:
+        manual_key = f"pf_manual_{name}"
+        st.session_state[manual_key] = safe_float(gb.get(gb_key, st.session_state.get(manual_key, 0.0)))
 
     # (Optional) keep paycheck breakdown drafts in sync
     st.session_state["pf_use_paycheck_breakdown"] = bool(
@@ -128,18 +164,18 @@ def apply_payload_to_state(payload: dict) -> None:
             st.session_state.get("pf_use_paycheck_breakdown", False),
         )
     )
-    st.session_state["pf_draft_taxes"] = st.session_state["pf_manual_taxes"]
-    st.session_state["pf_draft_retirement"] = st.session_state["pf_manual_retirement"]
-    st.session_state["pf_draft_match"] = st.session_state["pf_manual_match"]
-    st.session_state["pf_draft_benefits"] = st.session_state["pf_manual_benefits"]
-    st.session_state["pf_draft_other_ssi"] = st.session_state["pf_manual_other_ssi"]
+    for _, name in _GROSS_BREAKDOWN_FIELDS:
+        st.session_state[f"pf_draft_{name}"] = st.session_state[f"pf_manual_{name}"]
 
     # ---- Tables ----
     tables = payload.get("tables", {}) or {}
 
     def _set_table(key: str, records_key: str, expected_cols: list[str], numeric_cols: list[str]):
         records = tables.get(records_key) or []
-        df = pd.DataFrame(records)
+        # Known schema up front: no key-union scan, unknown keys are ignored
+        df = pd.DataFrame.from_records(records, columns=expected_cols)
+        text_cols = [c for c in expected_cols if c not in numeric_cols]
+        df[text_cols] = df[text_cols].fillna("")
         st.session_state[key] = sanitize_editor_df(df, expected_cols, numeric_cols)
 
     _set_table("pf_income_df", "income", ["Source", "Monthly Amount", "Notes"], ["Monthly Amount"])
@@ -175,11 +211,8 @@ def build_payload_from_state(metrics: dict) -> dict:
             "gross_mode": st.session_state.get("pf_gross_mode"),
         },
         "gross_breakdown_optional": {
-            "taxes": float(st.session_state.get("pf_manual_taxes", 0.0) or 0.0),
-            "retirement_employee": float(st.session_state.get("pf_manual_retirement", 0.0) or 0.0),
-            "company_match": float(st.session_state.get("pf_manual_match", 0.0) or 0.0),
-            "benefits": float(st.session_state.get("pf_manual_benefits", 0.0) or 0.0),
-            "other_ssi": float(st.session_state.get("pf_manual_other_ssi", 0.0) or 0.0),
+            gb_key: safe_float(st.session_state.get(f"pf_manual_{name}", 0.0) or 0.0)
+            for gb_key, name in _GROSS_BREAKDOWN_FIELDS
         },
         "monthly_cash_flow": {
             "total_income_entered": float(metrics.get("total_income", 0.0) or 0.0),
@@ -189,14 +222,7 @@ def build_payload_from_state(metrics: dict) -> dict:
             "paycheck_breakdown_enabled": bool(st.session_state.get("pf_use_paycheck_breakdown", False)),
         },
         "tables": {
-            "income": st.session_state["pf_income_df"].to_dict(orient="records"),
-            "fixed_expenses": st.session_state["pf_fixed_df"].to_dict(orient="records"),
-            "essential_expenses": st.session_state["pf_essential_df"].to_dict(orient="records"),
-            "nonessential_expenses": st.session_state["pf_nonessential_df"].to_dict(orient="records"),
-            "saving": st.session_state["pf_saving_df"].to_dict(orient="records"),
-            "investing": st.session_state["pf_investing_df"].to_dict(orient="records"),
-            "assets": st.session_state["pf_assets_df"].to_dict(orient="records"),
-            "liabilities": st.session_state["pf_liabilities_df"].to_dict(orient="records"),
-            "debt_details": st.session_state["pf_debt_df"].to_dict(orient="records"),
+            records_key: st.session_state[state_key].to_dict(orient="records")
+            for records_key, state_key in _PAYLOAD_TABLES
         },
     }
\ No newline at end of file
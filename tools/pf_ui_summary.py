@@ -9,6 +9,25 @@ from tools.pf_state import money, pct
 from tools.pf_visuals import cashflow_breakdown_chart
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_cashflow_chart(
+    net_income: float,
+    living_expenses: float,
+    debt_payments: float,
+    saving: float,
+    investing_cashflow: float,
+):
+    """The at-a-glance bar only changes when one of these five numbers does."""
+    fig, _, _ = cashflow_breakdown_chart(
+        net_income=net_income,
+        living_expenses=living_expenses,
+        debt_payments=debt_payments,
+        saving=saving,
+        investing_cashflow=investing_cashflow,
+    )
+    return fig
+
+
 def render_summary_panel(metrics: dict) -> None:
     """
     Renders the right-side panel.
@@ -112,12 +131,12 @@ def render_summary_panel(metrics: dict) -> None:
 
         # ---------- This Month at a Glance ----------
         st.subheader("This Month at a Glance")
-        fig, _, _ = cashflow_breakdown_chart(
-            net_income=net_income,
-            living_expenses=expenses_total,
-            debt_payments=debt_payments,
-            saving=saving_total,
-            investing_cashflow=investing_cashflow,
+        fig = _cached_cashflow_chart(
+            net_income,
+            expenses_total,
+            debt_payments,
+            saving_total,
+            investing_cashflow,
         )
         st.plotly_chart(fig, width="stretch")
 
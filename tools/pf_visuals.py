@@ -279,6 +279,7 @@ def debt_burden_indicator(*, net_income: float, debt_payments: float):
     fig.update_layout(
         height=190,
         margin=dict(l=10, r=10, t=10, b=10),
+        uirevision="pf",
     )
 
     return fig, pct
@@ -332,6 +333,10 @@ def debt_payoff_order_chart(debt_df: pd.DataFrame, *, strategy: str = "Avalanche
             orientation="h",
             customdata=df["APR %"],
             hovertemplate="%{y}<br>Balance: $%{x:,.0f}<br>APR: %{customdata:.2f}%<extra></extra>",
+            # APR label on each bar (Plotly doesn't need colors to make this useful)
+            text=[f"{apr:.1f}%" for apr in df["APR %"]],
+            textposition="outside",
+            cliponaxis=False,
         )
     )
 
@@ -341,14 +346,7 @@ def debt_payoff_order_chart(debt_df: pd.DataFrame, *, strategy: str = "Avalanche
         margin=dict(l=140, r=20, t=55, b=20),
         xaxis=dict(tickprefix="$", separatethousands=True, title="Balance"),
         yaxis=dict(autorange="reversed", title=""),
-    )
-
-    # If the user chose avalanche, add a small visual cue by showing APR text on bars
-    # (Plotly doesn't need colors to make this useful.)
-    fig.update_traces(
-        text=[f"{apr:.1f}%" for apr in df["APR %"]],
-        textposition="outside",
-        cliponaxis=False,
+        uirevision="pf",
     )
 
     return fig
\ No newline at end of file